@@ -7,28 +7,109 @@ local directories and a NAS, keeping the most recent version.
 """
 
 import os
+import re
 import sys
-import json
-import shutil
-import argparse
+import heapq
+import time
+import functools
+import itertools
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, FrozenSet, Iterator, List, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    # Optional; only makes reading and writing JSON faster
+    orjson = None
+
+# On Windows, the system's own copy function lets SMB shares copy files on
+# the server instead of passing every byte through this computer
+_win_copy_file = None
+if sys.platform == 'win32':
+    import ctypes
+    
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    if hasattr(_kernel32, 'CopyFile2'):
+        # Windows 8 and later
+        _kernel32.CopyFile2.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p)
+        _kernel32.CopyFile2.restype = ctypes.c_long
+        
+        def _win_copy_file(src: str, dst: str) -> bool:
+            return _kernel32.CopyFile2(src, dst, None) >= 0
+    else:
+        _kernel32.CopyFileExW.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p,
+                                          ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong)
+        _kernel32.CopyFileExW.restype = ctypes.c_int
+        
+        def _win_copy_file(src: str, dst: str) -> bool:
+            return bool(_kernel32.CopyFileExW(src, dst, None, None, None, 0))
 
 
 class SaveSync:
     """Handles synchronization of save files between local and NAS storage."""
     
-    def __init__(self, config_path: str, dry_run: bool = False):
+    # Timestamps closer than this (in seconds) are treated as equal when the
+    # sizes also match; FAT and SMB only store mtimes with 2 second granularity
+    MTIME_TOLERANCE = 2.0
+    
+    # Buffer size for copies that can't be done in the kernel; large reads
+    # and writes mean fewer round trips to the NAS for multi-MB memory cards
+    COPY_BUFFER_SIZE = 4 * 1024 * 1024
+    
+    # Copies of files up to this size are bound by per-file round trips
+    # rather than bandwidth, and are scheduled separately from larger ones
+    SMALL_FILE_SIZE = 64 * 1024
+    
+    # Suffix of the temporary files copies are written to; leftovers of
+    # interrupted runs are never synced
+    TEMP_SUFFIX = '.retrosavesync-tmp'
+    
+    # Per-file messages are written to stdout in batches of this many lines
+    LOG_FLUSH_LINES = 256
+    
+    # Content digests of NAS files, kept at the NAS root so that every
+    # computer syncing with it can reuse them
+    HASH_INDEX_NAME = '.retrosavesync_index.json'
+    
+    # NAS directory names of each Dolphin save type
+    DOLPHIN_NAS_DIRS = {'wii': 'Wii', 'gamecube': 'GC'}
+    
+    # Methods building the sync tasks and running the init wizard of each
+    # emulator, and the name of its NAS directory; supporting another
+    # emulator means adding an entry here
+    _EMULATOR_HANDLERS = {
+        'pcsx2': ('_pcsx2_tasks', '_init_emulator_pcsx2', 'PCSX2'),
+        'dolphin': ('_dolphin_tasks', '_init_emulator_dolphin', 'Dolphin'),
+    }
+    
+    def __init__(self, config_path: str, dry_run: bool = False, progress: bool = False,
+                 jobs: Optional[int] = None, force: bool = False):
         """Initialize SaveSync with configuration file.
         
         Args:
             config_path: Path to JSON configuration file
             dry_run: If True, only show what would be synced without actually syncing
+            progress: If True, show a progress bar per directory instead of a
+                line per copied file (requires tqdm)
+            jobs: Number of directories (e.g., PCSX2, Dolphin Wii) synced at once,
+                or None to sync all of them at once
+            force: If True, ignore the sync manifest and compare every file with the NAS
         """
         self.config = self._load_config(config_path)
         self.nas_path = Path(self.config['nas_path']).expanduser()
         self.dry_run = dry_run
+        # Progress bar class, imported only when a progress bar is wanted
+        self._tqdm = None
+        if progress:
+            try:
+                from tqdm import tqdm
+            except ImportError:
+                # Optional; needed for --progress
+                tqdm = None
+            self._tqdm = tqdm
+        self.show_progress = self._tqdm is not None
         self.sync_stats = {
             'uploaded': 0,
             'downloaded': 0,
@@ -36,12 +117,70 @@ class SaveSync:
             'errors': 0,
             'backed_up': 0
         }
+        self._stats_lock = threading.Lock()
+        
+        # Number of files compared (and small files copied) concurrently
+        # within a directory, of large files copied concurrently, and of
+        # directories listed concurrently while walking a tree
+        self.parallel_workers = max(self.config.get('parallel_workers', 16), 1)
+        self.large_file_workers = max(self.config.get('large_file_workers', 4), 1)
+        self.sync_threads = max(self.config.get('sync_threads', 8), 1)
+        self.jobs = max(jobs, 1) if jobs is not None else None
+        
+        # Per-file messages are buffered and written to stdout in batches.
+        # Threads working for a parallel sync task collect them in the task's
+        # own list instead (see _run_grouped).
+        self._log_lines = []
+        self._log_lock = threading.Lock()
+        self._log_group = threading.local()
+        
+        # Directories already created (or known to exist) during this run
+        self._ensured_dirs = set()
+        self._dirs_lock = threading.Lock()
+        
+        # os.stat() results of files looked up during this run, None if missing
+        self._stat_cache = {}
+        
+        # Delegate directory syncs and backups to rsync when requested and available
+        self.use_rsync = False
+        if self.config.get('use_rsync', False):
+            import shutil
+            self.use_rsync = shutil.which('rsync') is not None
         
         # Load backup configuration
         backup_config = self.config.get('backup', {})
         self.backup_enabled = backup_config.get('enabled', False)
         self.monthly_backups = backup_config.get('monthly_backups', True)
         self.backup_path = Path(backup_config.get('backup_path', 'backups'))
+        self._backup_root = self.nas_path / self.backup_path
+        self._monthly_backups_active = self.backup_enabled and self.monthly_backups
+        
+        # Load the sync manifest, which records files found in sync on
+        # earlier runs so unchanged ones can skip the NAS comparison
+        manifest_config = self.config.get('manifest', {})
+        self.manifest_enabled = manifest_config.get('enabled', False)
+        self.force = force
+        self.manifest_ttl = manifest_config.get('ttl_hours', 24) * 3600
+        cache_home = Path(os.environ.get('XDG_CACHE_HOME', '~/.cache')).expanduser()
+        self.manifest_path = cache_home / 'retrosavesync' / 'manifest.json'
+        self._manifest = self._load_manifest() if self.manifest_enabled else {}
+        self._manifest_lock = threading.Lock()
+        
+        # Digests of NAS files by path relative to nas_path, loaded on first use
+        self._hash_index = None
+        self._hash_index_dirty = False
+        self._hash_index_lock = threading.Lock()
+        
+        # (size, mtime_ns, digest) of local files hashed during this run,
+        # reused to index the NAS copy once they are uploaded
+        self._local_digests = {}
+        
+        # Resolve paths and extension filters of enabled emulators once
+        self._emulator_configs = {
+            name: self._resolve_emulator_config(name)
+            for name in self._EMULATOR_HANDLERS
+            if self.config['emulators'].get(name, {}).get('enabled', False)
+        }
     
     def _load_config(self, config_path: str) -> Dict:
         """Load and validate configuration from JSON file.
@@ -56,8 +195,7 @@ class SaveSync:
             FileNotFoundError: If config file doesn't exist
             json.JSONDecodeError: If config file is invalid JSON
         """
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = self._read_json(Path(config_path))
         
         if 'nas_path' not in config:
             raise ValueError("Configuration must include 'nas_path'")
@@ -66,79 +204,720 @@ class SaveSync:
             
         return config
     
-    def _get_file_mtime(self, file_path: Path) -> float:
-        """Get modification time of a file.
+    @staticmethod
+    def _read_json(path: Path) -> object:
+        """Read a JSON file, using orjson when it is installed.
+        
+        Args:
+            path: Path to JSON file
+            
+        Returns:
+            Parsed JSON value
+            
+        Raises:
+            OSError: If the file can't be read
+            json.JSONDecodeError: If the file is invalid JSON
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        import json
+        return json.loads(data)
+    
+    @staticmethod
+    def _write_json(path: Path, value: object) -> None:
+        """Write a JSON file atomically, using orjson when it is installed.
+        
+        Args:
+            path: Path to JSON file
+            value: Value to serialize
+            
+        Raises:
+            OSError: If the file can't be written
+        """
+        if orjson is not None:
+            data = orjson.dumps(value)
+        else:
+            import json
+            data = json.dumps(value).encode()
+        import tempfile
+        # Other computers may be writing the same file (e.g. the NAS hash
+        # index), so each writer gets its own temporary file
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', prefix=f".{path.name}.",
+                                        dir=path.parent)
+        try:
+            with open(fd, 'wb') as f:
+                f.write(data)
+            # mkstemp() creates the file readable by its owner only
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _load_manifest(self) -> Dict:
+        """Load the sync manifest from the cache directory.
+        
+        Returns:
+            Manifest dictionary, or an empty one if missing or unreadable
+        """
+        try:
+            manifest = self._read_json(self.manifest_path)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+    
+    def _save_manifest(self) -> None:
+        """Write the sync manifest to the cache directory."""
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_json(self.manifest_path, self._manifest)
+        except OSError as e:
+            self._log(f"  Warning: could not save sync manifest: {e}")
+    
+    def _load_hash_index(self) -> Dict:
+        """Load the index of NAS file digests, once per run.
+        
+        Returns:
+            Mapping of paths relative to nas_path to their size, mtime_ns
+            and digest at the time they were hashed
+        """
+        with self._hash_index_lock:
+            if self._hash_index is None:
+                try:
+                    index = self._read_json(self.nas_path / self.HASH_INDEX_NAME)
+                except (OSError, ValueError):
+                    index = {}
+                self._hash_index = index if isinstance(index, dict) else {}
+            return self._hash_index
+    
+    def _save_hash_index(self) -> None:
+        """Write the index of NAS file digests if it changed during this run."""
+        with self._hash_index_lock:
+            if not self._hash_index_dirty or self.dry_run:
+                return
+            try:
+                self._write_json(self.nas_path / self.HASH_INDEX_NAME, self._hash_index)
+                self._hash_index_dirty = False
+            except OSError as e:
+                self._log(f"  Warning: could not save NAS hash index: {e}")
+        self._flush_log()
+    
+    def _resolve_emulator_config(self, name: str) -> Dict:
+        """Resolve the local/NAS paths and extension filter of an emulator.
+        
+        Args:
+            name: Emulator key in the configuration (e.g., 'pcsx2', 'dolphin')
+            
+        Returns:
+            Dictionary with 'local' and 'nas' paths, 'extensions' (a frozenset
+            of lowercase extensions, or None to sync all files) and, for
+            Dolphin, 'saves' mapping each save type to its local directory
+        """
+        config = self.config['emulators'][name]
+        _, _, nas_dir = self._EMULATOR_HANDLERS[name]
+        local_path = Path(config['save_path']).expanduser()
+        extensions = frozenset(
+            ext.lower() if ext.startswith('.') else '.' + ext.lower()
+            for ext in config.get('extensions', [])
+        )
+        
+        return {
+            'local': local_path,
+            'nas': self.nas_path / nas_dir,
+            'extensions': extensions or None,
+            'saves': {save_type: local_path / subdir
+                      for save_type, subdir in config.get('saves', {}).items()},
+        }
+    
+    def _count(self, stat: str) -> None:
+        """Increment a sync statistic in a thread-safe way.
+        
+        Args:
+            stat: Key in sync_stats (e.g., 'uploaded', 'errors')
+        """
+        with self._stats_lock:
+            self.sync_stats[stat] += 1
+    
+    def _log(self, message: str) -> None:
+        """Buffer a per-file message, writing the buffer once it is full.
+        
+        Safe to call from worker threads; lines are never interleaved.
+        
+        Args:
+            message: Line to print
+        """
+        group = getattr(self._log_group, 'lines', None)
+        with self._log_lock:
+            if group is not None:
+                group.append(message)
+                return
+            self._log_lines.append(message)
+            if len(self._log_lines) >= self.LOG_FLUSH_LINES:
+                self._write_log_lines()
+    
+    def _join_log_group(self, lines: Optional[List[str]]) -> None:
+        """Collect the current thread's messages in a list instead of printing them.
+        
+        Args:
+            lines: List receiving the messages, or None to print them again
+        """
+        self._log_group.lines = lines
+    
+    def _flush_log(self) -> None:
+        """Write any buffered messages to stdout."""
+        with self._log_lock:
+            self._write_log_lines()
+    
+    def _write_log_lines(self) -> None:
+        """Write and clear the message buffer. The log lock must be held."""
+        if self._log_lines:
+            sys.stdout.write('\n'.join(self._log_lines) + '\n')
+            sys.stdout.flush()
+            self._log_lines.clear()
+    
+    def _ensure_dir(self, directory: str) -> None:
+        """Create a directory (and parents) unless already done during this run.
+        
+        Once created, the directory and all of its ancestors are known to
+        exist, so files in sibling or parent directories need no mkdir call.
+        
+        Args:
+            directory: Directory that must exist
+        """
+        with self._dirs_lock:
+            if directory in self._ensured_dirs:
+                return
+        # Worker threads may race to create the same directory; that's harmless
+        os.makedirs(directory, exist_ok=True)
+        self._remember_dir(directory)
+    
+    def _remember_dir(self, directory: str) -> None:
+        """Record that a directory, and therefore all its ancestors, exists.
+        
+        Args:
+            directory: Existing directory
+        """
+        with self._dirs_lock:
+            while directory not in self._ensured_dirs:
+                self._ensured_dirs.add(directory)
+                parent = os.path.dirname(directory)
+                if parent == directory:
+                    break
+                directory = parent
+    
+    def _fast_copy(self, src: str, dst: str) -> os.stat_result:
+        """Copy a file's contents, permission bits and timestamps.
+        
+        Uses CopyFile2 on Windows, and os.copy_file_range or os.sendfile
+        elsewhere, so the data never passes through user space. Otherwise
+        falls back to reading into a single COPY_BUFFER_SIZE buffer.
+        
+        The copy is written to a uniquely named temporary file next to dst
+        that then replaces it, so an existing dst is never modified in place.
+        This keeps hard-linked monthly backups of dst intact.
+        
+        Unlike shutil.copy2, no flags or extended attributes are copied;
+        save files don't carry any, and skipping them saves the extra stat
+        and xattr calls per file.
+        
+        Args:
+            src: Source file path
+            dst: Destination file path
+            
+        Returns:
+            os.stat_result of src, taken when the copy started
+        """
+        import tempfile
+        dst_dir, dst_name = os.path.split(dst)
+        fd, tmp_path = tempfile.mkstemp(suffix=self.TEMP_SUFFIX, prefix=f".{dst_name}.",
+                                        dir=dst_dir)
+        os.close(fd)
+        try:
+            src_stat = self._copy_contents(src, tmp_path)
+            # mkstemp() creates the file readable by its owner only
+            os.chmod(tmp_path, src_stat.st_mode & 0o777)
+            # Preserve mtime, which the timestamp comparison relies on
+            os.utime(tmp_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            os.replace(tmp_path, dst)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return src_stat
+    
+    def _copy_contents(self, src: str, dst: str) -> os.stat_result:
+        """Copy the contents of src into dst, replacing any previous contents.
+        
+        Args:
+            src: Source file path
+            dst: Destination file path
+            
+        Returns:
+            os.stat_result of src, taken when the copy started
+        """
+        if _win_copy_file is not None:
+            src_stat = os.stat(src)
+            if _win_copy_file(src, dst):
+                return src_stat
+            # e.g. the share refused it; copy through a buffer instead
+        with open(src, 'rb', buffering=0) as fsrc:
+            src_stat = os.fstat(fsrc.fileno())
+            with open(dst, 'wb') as fdst:
+                src_fd = fsrc.fileno()
+                dst_fd = fdst.fileno()
+                size = src_stat.st_size
+                offset = 0
+                if hasattr(os, 'copy_file_range'):
+                    # Lets NFS and SMB mounts copy on the server (Linux 4.5+)
+                    try:
+                        while offset < size:
+                            copied = os.copy_file_range(src_fd, dst_fd, size - offset,
+                                                        offset, offset)
+                            if copied == 0:
+                                break
+                            offset += copied
+                    except OSError:
+                        # e.g. not supported by the kernel or across filesystems
+                        pass
+                if offset < size and hasattr(os, 'sendfile'):
+                    try:
+                        os.lseek(dst_fd, offset, os.SEEK_SET)
+                        while offset < size:
+                            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                            if sent == 0:
+                                break
+                            offset += sent
+                    except OSError:
+                        # e.g. macOS only supports sockets as the destination
+                        pass
+                if offset < size:
+                    fsrc.seek(offset)
+                    fdst.seek(offset)
+                    buffer = memoryview(bytearray(self.COPY_BUFFER_SIZE))
+                    while True:
+                        read = fsrc.readinto(buffer)
+                        if not read:
+                            break
+                        fdst.write(buffer[:read])
+        return src_stat
+    
+    def _walk(self, root: Path, recursive: bool = True,
+              extensions: Optional[FrozenSet[str]] = None,
+              stat: bool = True) -> Iterator[Tuple[str, Optional[os.stat_result]]]:
+        """Walk a directory, yielding the stat result of each file found.
+        
+        Uses os.scandir so the entry type comes from the directory listing
+        and each file is stat'ed only once, instead of the separate exists()
+        and stat() calls per file that rglob() plus _sync_file would make.
+        
+        Files are yielded in sorted order of their relative paths, so two
+        walks can be merged without building and sorting their union.
+        
+        Args:
+            root: Directory to walk
+            recursive: Whether to descend into subdirectories
+            extensions: Set of lowercase file extensions to include (e.g., {'.ps2', '.gci'})
+            stat: If False, only list files and yield None instead of stat results
+            
+        Yields:
+            Tuples of (path relative to root as a string, os.stat_result)
+        """
+        # Directories are listed on a thread pool, so the network round
+        # trips of a NAS walk overlap instead of adding up
+        root = os.fspath(root)
+        listings = {}
+        with ThreadPoolExecutor(max_workers=self.sync_threads) as executor:
+            pending = {executor.submit(self._scan_dir, root, extensions, stat): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory = pending.pop(future)
+                    listings[directory] = future.result()
+                    if recursive:
+                        for key, subdir, entry_stat in listings[directory]:
+                            if subdir is not None:
+                                pending[executor.submit(self._scan_dir, subdir,
+                                                        extensions, stat)] = subdir
+        
+        # Relative paths are built as plain strings, which are cheaper to
+        # construct and hash than Path objects
+        return self._walk_listing(listings, root, '')
+    
+    def _scan_dir(self, directory: str, extensions: Optional[FrozenSet[str]],
+                  stat: bool) -> List[Tuple[str, Optional[str], Optional[os.stat_result]]]:
+        """List one directory for _walk().
+        
+        Args:
+            directory: Directory to list
+            extensions: Set of lowercase file extensions to include
+            stat: If False, only list files; their stat results are None
+            
+        Returns:
+            Sorted tuples of (name, None, os.stat_result) for files and
+            (name + separator, path, None) for subdirectories
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except (FileNotFoundError, PermissionError):
+            # Missing directories simply have no files to sync
+            return []
+        
+        listing = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Sorting directories as 'name/' keeps the depth-first order
+                # identical to the string order of the full relative paths
+                listing.append((entry.name + os.sep, entry.path, None))
+            elif entry.is_file():
+                name = entry.name
+                if name.endswith(self.TEMP_SUFFIX):
+                    # Left behind by an interrupted copy
+                    continue
+                if extensions is not None:
+                    # Same suffix as os.path.splitext(), without the extra calls
+                    dot = name.rfind('.')
+                    if dot <= 0 or name[dot:].lower() not in extensions:
+                        continue
+                # DirEntry caches its stat result, so each file is stat'ed once
+                listing.append((name, None, entry.stat() if stat else None))
+        listing.sort()
+        return listing
+    
+    def _walk_listing(self, listings: Dict[str, List[Tuple]], directory: str,
+                      rel_dir: str) -> Iterator[Tuple[str, Optional[os.stat_result]]]:
+        """Yield the files below one directory from the listings made by _walk().
+        
+        Args:
+            listings: Mapping of listed directories to their _scan_dir() result
+            directory: Directory whose files are yielded
+            rel_dir: Path of directory relative to the walk root, ending in a
+                separator (empty for the root itself)
+        """
+        for key, subdir, entry_stat in listings[directory]:
+            if subdir is None:
+                yield rel_dir + key, entry_stat
+            elif subdir in listings:
+                yield from self._walk_listing(listings, subdir, rel_dir + key)
+    
+    def _collect_files(self, root: Path, recursive: bool = True,
+                       extensions: Optional[FrozenSet[str]] = None,
+                       stat: bool = True) -> Dict[str, Optional[os.stat_result]]:
+        """Collect the stat results of all files below a directory.
+        
+        Args:
+            root: Directory to scan
+            recursive: Whether to include subdirectories
+            extensions: Set of lowercase file extensions to include (e.g., {'.ps2', '.gci'})
+            stat: If False, only list files and map each of them to None
+            
+        Returns:
+            Mapping of relative paths to os.stat_result
+        """
+        return dict(self._walk(root, recursive, extensions, stat))
+    
+    def _get_file_stat(self, file_path: str) -> Optional[os.stat_result]:
+        """Get the stat result of a file.
+        
+        Results are cached for the rest of the run, so repeated lookups of
+        the same path don't go back to the NAS. Call _invalidate_stat()
+        after writing to a file.
         
         Args:
             file_path: Path to file
             
         Returns:
-            Modification time as timestamp, or 0 if file doesn't exist
+            os.stat_result of the file, or None if file doesn't exist
         """
         try:
-            return file_path.stat().st_mtime
+            return self._stat_cache[file_path]
+        except KeyError:
+            pass
+        try:
+            file_stat = os.stat(file_path)
         except FileNotFoundError:
-            return 0.0
+            file_stat = None
+        self._stat_cache[file_path] = file_stat
+        return file_stat
+    
+    def _invalidate_stat(self, file_path: str) -> None:
+        """Forget the cached stat result of a file that has been written.
+        
+        Args:
+            file_path: Path to file
+        """
+        self._stat_cache.pop(file_path, None)
     
-    def _create_monthly_backup(self, nas_file: Path, emulator: str) -> bool:
+    def _file_digest(self, file_path: str) -> str:
+        """Hash the contents of a file.
+        
+        Args:
+            file_path: Path to file
+            
+        Returns:
+            Hex BLAKE2b digest of the file
+        """
+        import hashlib
+        digest = hashlib.blake2b(digest_size=16)
+        buffer = memoryview(bytearray(self.COPY_BUFFER_SIZE))
+        with open(file_path, 'rb', buffering=0) as f:
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                digest.update(buffer[:read])
+        return digest.hexdigest()
+    
+    def _nas_key(self, nas_path: str) -> str:
+        """Return the path of a NAS file relative to nas_path, for the hash index.
+        
+        Keys always use '/' so Windows and POSIX computers share them.
+        
+        Args:
+            nas_path: NAS file path, built from nas_path
+        """
+        key = nas_path[len(os.fspath(self.nas_path)) + 1:]
+        if os.sep != '/':
+            key = key.replace(os.sep, '/')
+        return key
+    
+    def _nas_digest(self, nas_path: str, nas_stat: os.stat_result) -> str:
+        """Hash a NAS file, reusing the digest in the hash index if still valid.
+        
+        Args:
+            nas_path: NAS file path
+            nas_stat: os.stat_result of the NAS file
+            
+        Returns:
+            Hex BLAKE2b digest of the file
+        """
+        index = self._load_hash_index()
+        key = self._nas_key(nas_path)
+        entry = index.get(key)
+        if (isinstance(entry, dict) and entry.get('size') == nas_stat.st_size
+                and entry.get('mtime_ns') == nas_stat.st_mtime_ns):
+            return entry['digest']
+        
+        digest = self._file_digest(nas_path)
+        with self._hash_index_lock:
+            index[key] = {'size': nas_stat.st_size, 'mtime_ns': nas_stat.st_mtime_ns,
+                          'digest': digest}
+            self._hash_index_dirty = True
+        return digest
+    
+    def _update_nas_digest(self, nas_path: str, digest: Optional[str]) -> None:
+        """Re-index a NAS file that has been overwritten or retimed.
+        
+        Args:
+            nas_path: NAS file path
+            digest: Digest of the file's current contents, or None if unknown,
+                in which case its indexed digest is dropped
+        """
+        self._invalidate_stat(nas_path)
+        nas_stat = self._get_file_stat(nas_path) if digest is not None else None
+        index = self._load_hash_index()
+        key = self._nas_key(nas_path)
+        with self._hash_index_lock:
+            if nas_stat is not None:
+                index[key] = {'size': nas_stat.st_size, 'mtime_ns': nas_stat.st_mtime_ns,
+                              'digest': digest}
+                self._hash_index_dirty = True
+            elif index.pop(key, None) is not None:
+                self._hash_index_dirty = True
+    
+    def _local_digest(self, local_path: str, local_stat: os.stat_result) -> str:
+        """Hash a local file, remembering the digest for the rest of the run.
+        
+        Args:
+            local_path: Local file path
+            local_stat: os.stat_result of the local file
+            
+        Returns:
+            Hex BLAKE2b digest of the file
+        """
+        digest = self._file_digest(local_path)
+        self._local_digests[local_path] = (local_stat.st_size, local_stat.st_mtime_ns, digest)
+        return digest
+    
+    def _pop_local_digest(self, local_path: str,
+                          local_stat: Optional[os.stat_result]) -> Optional[str]:
+        """Take the digest _local_digest() recorded for a local file.
+        
+        Args:
+            local_path: Local file path
+            local_stat: os.stat_result the file had when it was copied
+            
+        Returns:
+            Hex digest, or None if the file wasn't hashed with that size and mtime
+        """
+        entry = self._local_digests.pop(local_path, None)
+        if (entry is None or local_stat is None
+                or entry[:2] != (local_stat.st_size, local_stat.st_mtime_ns)):
+            return None
+        return entry[2]
+    
+    def _same_contents(self, local_path: str, nas_path: str,
+                       local_stat: os.stat_result, nas_stat: os.stat_result) -> bool:
+        """Check whether a local and a NAS file of the same size are identical.
+        
+        Args:
+            local_path: Local file path
+            nas_path: NAS file path
+            local_stat: os.stat_result of the local file
+            nas_stat: os.stat_result of the NAS file
+            
+        Returns:
+            True if both files have the same contents, False if they differ
+            or either can't be read
+        """
+        try:
+            return (self._local_digest(local_path, local_stat)
+                    == self._nas_digest(nas_path, nas_stat))
+        except OSError:
+            # Let the copy report the problem
+            return False
+    
+    def _create_monthly_backup(self, nas_file: Path, emulator: str,
+                               quiet: bool = False) -> bool:
         """Create a monthly backup of a NAS file.
         
+        Callers pass files already found by a directory walk, so the file's
+        existence is not checked again here.
+        
         Args:
-            nas_file: Path to the NAS file
+            nas_file: Path to an existing NAS file
             emulator: Emulator name (e.g., 'PCSX2', 'Dolphin')
+            quiet: If True, don't print a message for a successful backup
             
         Returns:
             True if backup was created, False otherwise
         """
         # Check if backups are enabled and monthly backups are configured
         # monthly_backups allows for future extensibility (e.g., daily/weekly backups)
-        if not self.backup_enabled or not self.monthly_backups:
-            return False
-        
-        if not nas_file.exists():
+        if not self._monthly_backups_active:
             return False
         
         # Validate emulator parameter
         if not emulator:
             return False
         
-        # Get current year-month for backup directory
-        now = datetime.now()
-        backup_month = now.strftime('%Y-%m')
+        backup_dir, prefix = self._backup_target(nas_file.parent, emulator)
+        return self._create_monthly_backup_one(str(nas_file), prefix + nas_file.name,
+                                               backup_dir, quiet=quiet)
+    
+    def _backup_target(self, nas_dir: Path, emulator: str) -> Tuple[Path, str]:
+        """Resolve where this month's backups of files in a NAS directory go.
+        
+        Computed once per synced directory instead of once per backed up file.
         
+        Args:
+            nas_dir: NAS directory containing (or above) the files to back up
+            emulator: Emulator name (e.g., 'PCSX2', 'Dolphin')
+            
+        Returns:
+            Tuple of (this month's backup directory of the emulator, prefix to
+            prepend to paths relative to nas_dir to make them relative to it)
+        """
         # Create backup directory structure: nas_path/backups/YYYY-MM/emulator/
-        backup_dir = self.nas_path / self.backup_path / backup_month / emulator
+        backup_month = time.strftime('%Y-%m')
+        backup_dir = self._backup_root / backup_month / emulator
         
-        # Get relative path from emulator directory
-        emulator_base = self.nas_path / emulator
-        if nas_file.is_relative_to(emulator_base):
-            rel_path = nas_file.relative_to(emulator_base)
+        # Backups mirror the layout below the emulator's NAS directory;
+        # both paths are built from nas_path, so a string prefix check will do
+        nas_str = os.fspath(nas_dir) + os.sep
+        base_str = os.fspath(self.nas_path / emulator) + os.sep
+        if nas_str.startswith(base_str):
+            prefix = nas_str[len(base_str):]
         else:
-            # Fallback to just the filename
-            rel_path = nas_file.name
+            # Fallback to paths relative to nas_dir itself
+            prefix = ''
+        return backup_dir, prefix
+    
+    def _create_monthly_backup_one(self, nas_file: str, rel_path: str, backup_dir: Path,
+                                   existing: Optional[set] = None,
+                                   quiet: bool = False) -> bool:
+        """Back up one NAS file into an already resolved monthly backup directory.
         
+        Args:
+            nas_file: Path to an existing NAS file
+            rel_path: Path of the file relative to its emulator's NAS directory
+            backup_dir: This month's backup directory of the emulator
+                (e.g., nas_path/backups/2024-01/PCSX2)
+            existing: Relative paths already backed up this month for the
+                emulator; checked instead of stat'ing the backup file
+            quiet: If True, don't print a message for a successful backup
+            
+        Returns:
+            True if backup was created, False otherwise
+        """
         backup_file = backup_dir / rel_path
+        backup_month = backup_dir.parent.name
         
         # Check if backup already exists for this month
-        if backup_file.exists():
+        if existing is not None:
+            if rel_path in existing:
+                return False
+        elif self._get_file_stat(str(backup_file)) is not None:
             return False
         
         try:
             if self.dry_run:
-                print(f"  [DRY RUN] Would create backup: {backup_month}/{emulator}/{rel_path}")
+                self._log(f"  [DRY RUN] Would create backup: {backup_month}/{backup_dir.name}/{rel_path}")
             else:
                 # Ensure backup directory exists
-                backup_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(nas_file, backup_file)
-                print(f"  💾 Backed up: {rel_path} -> backups/{backup_month}/")
-            self.sync_stats['backed_up'] += 1
+                self._ensure_dir(str(backup_file.parent))
+                # A hard link needs no data copy; it stays a snapshot because
+                # syncs replace NAS files instead of rewriting them in place
+                try:
+                    os.link(nas_file, backup_file)
+                except FileExistsError:
+                    # Backed up this month after the check above; keep that copy
+                    return False
+                except OSError:
+                    # Not supported by the filesystem or across devices
+                    self._fast_copy(nas_file, str(backup_file))
+                self._invalidate_stat(str(backup_file))
+                if not quiet:
+                    self._log(f"  💾 Backed up: {rel_path} -> backups/{backup_month}/")
+            self._count('backed_up')
             return True
         except Exception as e:
-            print(f"  ✗ Error creating backup for {nas_file.name}: {e}")
+            self._log(f"  ✗ Error creating backup for {os.path.basename(nas_file)}: {e}")
             return False
     
-    def _sync_file(self, local_path: Path, nas_path: Path, direction: str = 'auto',
-                   emulator: Optional[str] = None) -> bool:
+    def _backup_tree(self, nas_dir: Path, backup_dir: Path) -> None:
+        """Back up every file below a NAS emulator directory, in parallel.
+        
+        Args:
+            nas_dir: NAS directory of the emulator (e.g., nas_path/PCSX2)
+            backup_dir: This month's backup directory of the emulator
+        """
+        if not self.monthly_backups:
+            return
+        
+        # List this month's backups once instead of checking each file
+        existing = set(self._collect_files(backup_dir, stat=False))
+        nas_base = os.fspath(nas_dir) + os.sep
+        
+        with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+            for rel_path, _ in self._walk(nas_dir, stat=False):
+                executor.submit(self._create_monthly_backup_one, nas_base + rel_path,
+                                rel_path, backup_dir, existing)
+    
+    def _sync_file(self, local_path: str, nas_path: str, direction: str = 'auto',
+                   emulator: Optional[str] = None,
+                   local_stat: Optional[os.stat_result] = None,
+                   nas_stat: Optional[os.stat_result] = None,
+                   quiet: bool = False,
+                   backup_dir: Optional[Path] = None,
+                   backup_rel_path: Optional[str] = None) -> Optional[str]:
         """Sync a single file between local and NAS.
         
         Args:
@@ -146,70 +925,371 @@ class SaveSync:
             nas_path: NAS file path
             direction: 'auto' (based on timestamp), 'upload', or 'download'
             emulator: Emulator name for backup organization (e.g., 'PCSX2', 'Dolphin')
+            local_stat: os.stat_result of the local file, or None if it doesn't exist
+            nas_stat: os.stat_result of the NAS file, or None if it doesn't exist
+            quiet: If True, don't print messages for successful copies
+            backup_dir: This month's backup directory of the emulator, if
+                already resolved (see _backup_target)
+            backup_rel_path: Path of the NAS file relative to backup_dir
             
         Returns:
-            True if sync was performed, False if skipped
+            'upload' or 'download' for the copy performed, 'skip' if the file
+            was already in sync, or None if nothing could be synced
         """
-        local_exists = local_path.exists()
-        nas_exists = nas_path.exists()
+        action = self._plan_sync(local_path, nas_path, direction, local_stat, nas_stat)
+        return self._execute_sync(local_path, nas_path, action, local_stat, nas_stat,
+                                  emulator=emulator, quiet=quiet, backup_dir=backup_dir,
+                                  backup_rel_path=backup_rel_path)
+    
+    def _execute_sync(self, local_path: str, nas_path: str, action: Optional[str],
+                      local_stat: Optional[os.stat_result],
+                      nas_stat: Optional[os.stat_result],
+                      emulator: Optional[str] = None,
+                      quiet: bool = False,
+                      backup_dir: Optional[Path] = None,
+                      backup_rel_path: Optional[str] = None) -> Optional[str]:
+        """Carry out the action _plan_sync() chose for a file.
         
-        # If neither exists, nothing to sync
-        if not local_exists and not nas_exists:
-            return False
+        Args:
+            local_path: Local file path
+            nas_path: NAS file path
+            action: Result of _plan_sync() for the file
+            local_stat: os.stat_result of the local file, or None if it doesn't exist
+            nas_stat: os.stat_result of the NAS file, or None if it doesn't exist
+            emulator: Emulator name for backup organization (e.g., 'PCSX2', 'Dolphin')
+            quiet: If True, don't print messages for successful copies
+            backup_dir: This month's backup directory of the emulator, if
+                already resolved (see _backup_target)
+            backup_rel_path: Path of the NAS file relative to backup_dir
+            
+        Returns:
+            Same as _sync_file()
+        """
+        if action == 'align':
+            # Only the timestamps differ (e.g. the file was touched); give the
+            # older copy the newer mtime so later runs skip it without hashing
+            if not self.dry_run:
+                self._align_mtimes(local_path, nas_path, local_stat, nas_stat)
+            action = 'skip'
         
-        # Determine sync direction
-        if direction == 'auto':
-            if not nas_exists:
-                direction = 'upload'
-            elif not local_exists:
-                direction = 'download'
-            else:
-                local_mtime = self._get_file_mtime(local_path)
-                nas_mtime = self._get_file_mtime(nas_path)
-                
-                if local_mtime > nas_mtime:
-                    direction = 'upload'
-                elif nas_mtime > local_mtime:
-                    direction = 'download'
-                else:
-                    # Files are identical in timestamp
-                    self.sync_stats['skipped'] += 1
-                    return False
+        if action == 'skip':
+            self._count('skipped')
+            return 'skip'
+        elif action is None:
+            return None
         
         try:
-            if direction == 'upload':
+            if action == 'upload':
                 # Create backup of existing NAS file before overwriting
-                if nas_exists and emulator:
-                    self._create_monthly_backup(nas_path, emulator)
+                if nas_stat is not None and backup_dir is not None:
+                    self._create_monthly_backup_one(nas_path, backup_rel_path, backup_dir,
+                                                    quiet=quiet)
+                elif nas_stat is not None and emulator:
+                    self._create_monthly_backup(Path(nas_path), emulator, quiet=quiet)
                 
                 if self.dry_run:
-                    print(f"  [DRY RUN] Would upload: {local_path.name}")
+                    self._log(f"  [DRY RUN] Would upload: {os.path.basename(local_path)}")
                 else:
                     # Ensure NAS directory exists
-                    nas_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(local_path, nas_path)
-                    print(f"  ↑ Uploaded: {local_path.name}")
-                self.sync_stats['uploaded'] += 1
-                return True
-            elif direction == 'download':
+                    self._ensure_dir(os.path.dirname(nas_path))
+                    copied_stat = self._fast_copy(local_path, nas_path)
+                    # A same-size upload was hashed while planning; the new
+                    # NAS copy has the same digest unless the local file
+                    # changed since then
+                    self._update_nas_digest(nas_path,
+                                            self._pop_local_digest(local_path, copied_stat))
+                    if not quiet:
+                        self._log(f"  ↑ Uploaded: {os.path.basename(local_path)}")
+                self._count('uploaded')
+            else:
                 if self.dry_run:
-                    print(f"  [DRY RUN] Would download: {local_path.name}")
+                    self._log(f"  [DRY RUN] Would download: {os.path.basename(local_path)}")
                 else:
                     # Ensure local directory exists
-                    local_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(nas_path, local_path)
-                    print(f"  ↓ Downloaded: {local_path.name}")
-                self.sync_stats['downloaded'] += 1
-                return True
+                    self._ensure_dir(os.path.dirname(local_path))
+                    self._fast_copy(nas_path, local_path)
+                    self._invalidate_stat(local_path)
+                    if not quiet:
+                        self._log(f"  ↓ Downloaded: {os.path.basename(local_path)}")
+                self._count('downloaded')
         except Exception as e:
-            print(f"  ✗ Error syncing {local_path.name}: {e}")
-            self.sync_stats['errors'] += 1
-            return False
+            self._log(f"  ✗ Error syncing {os.path.basename(local_path)}: {e}")
+            self._count('errors')
+            return None
         
-        return False
+        return action
+    
+    def _plan_sync(self, local_path: str, nas_path: str, direction: str,
+                   local_stat: Optional[os.stat_result],
+                   nas_stat: Optional[os.stat_result]) -> Optional[str]:
+        """Decide what _sync_file has to do with a file, without copying or retiming it.
+        
+        Only reads file contents when both copies have the same size but
+        different timestamps. The digests computed then are recorded: the
+        NAS one in the shared hash index (written to the NAS at the end of
+        the run) and the local one for _execute_sync() to index after an
+        upload.
+        
+        Args:
+            local_path: Local file path
+            nas_path: NAS file path
+            direction: 'auto' (based on timestamp), 'upload', or 'download'
+            local_stat: os.stat_result of the local file, or None if it doesn't exist
+            nas_stat: os.stat_result of the NAS file, or None if it doesn't exist
+            
+        Returns:
+            'upload' or 'download' for the copy to make, 'skip' if the file is
+            in sync, 'align' if only the timestamps differ, or None if
+            neither file exists
+        """
+        local_exists = local_stat is not None
+        nas_exists = nas_stat is not None
+        
+        # If neither exists, nothing to sync
+        if not local_exists and not nas_exists:
+            return None
+        
+        # Both paths may lead to the same file (e.g. through a bind mount or
+        # a loopback share); st_ino is 0 where scandir doesn't report it
+        if (local_exists and nas_exists and local_stat.st_ino
+                and local_stat.st_ino == nas_stat.st_ino
+                and local_stat.st_dev == nas_stat.st_dev):
+            return 'skip'
+        
+        if direction != 'auto':
+            return direction
+        
+        # Determine sync direction
+        if not nas_exists:
+            return 'upload'
+        elif not local_exists:
+            return 'download'
+        
+        local_mtime = local_stat.st_mtime
+        nas_mtime = nas_stat.st_mtime
+        
+        same_size = local_stat.st_size == nas_stat.st_size
+        if same_size and abs(local_mtime - nas_mtime) <= self.MTIME_TOLERANCE:
+            # Same size and timestamps within filesystem granularity
+            return 'skip'
+        elif same_size and self._same_contents(local_path, nas_path, local_stat, nas_stat):
+            return 'align'
+        elif local_mtime > nas_mtime:
+            return 'upload'
+        elif nas_mtime > local_mtime:
+            return 'download'
+        else:
+            # Files are identical in timestamp
+            return 'skip'
+    
+    def _align_mtimes(self, local_path: str, nas_path: str,
+                      local_stat: os.stat_result, nas_stat: os.stat_result) -> None:
+        """Give the older of two identical files the mtime of the newer one.
+        
+        A NAS file that is hard-linked to a monthly backup is left alone,
+        since retiming it would retime the backup too. A retimed local
+        file's new stat result is cached (see _get_file_stat).
+        
+        Args:
+            local_path: Local file path
+            nas_path: NAS file path
+            local_stat: os.stat_result of the local file
+            nas_stat: os.stat_result of the NAS file
+        """
+        self._local_digests.pop(local_path, None)
+        if local_stat.st_mtime < nas_stat.st_mtime:
+            older_path, older_stat, newer_stat = local_path, local_stat, nas_stat
+        else:
+            older_path, older_stat, newer_stat = nas_path, nas_stat, local_stat
+        try:
+            if older_path is nas_path:
+                # scandir() reports no link count on Windows
+                nlink = nas_stat.st_nlink or os.stat(nas_path).st_nlink
+                if nlink > 1:
+                    return
+                # The NAS contents are unchanged, so its indexed digest is too
+                digest = self._nas_digest(nas_path, nas_stat)
+            os.utime(older_path, ns=(older_stat.st_atime_ns, newer_stat.st_mtime_ns))
+            self._invalidate_stat(older_path)
+            if older_path is nas_path:
+                # Keep the indexed digest valid for the new mtime
+                self._update_nas_digest(nas_path, digest)
+            else:
+                self._get_file_stat(local_path)
+        except OSError:
+            # The files are still identical; retried next run
+            pass
+    
+    def _run_rsync(self, source: Path, dest: Path,
+                   options: List[str]) -> Optional[List[Tuple[str, str]]]:
+        """Run rsync from one directory to another and parse its itemized output.
+        
+        Args:
+            source: Directory whose contents are copied
+            dest: Directory receiving the contents
+            options: Extra rsync options (e.g., ['--update', '--dry-run'])
+            
+        Returns:
+            List of (item flags, relative path) for every file rsync reported,
+            or None if rsync failed
+        """
+        # '-ii' also itemizes unchanged files; '|' never appears in the flags
+        cmd = ['rsync', '--archive', '--no-owner', '--no-group', '--copy-links',
+               '--itemize-changes', '--itemize-changes', '--out-format=%i|%n',
+               f'--exclude=*{self.TEMP_SUFFIX}', *options, os.fspath(source) + os.sep, os.fspath(dest) + os.sep]
+        import subprocess
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        except OSError as e:
+            self._log(f"  ✗ Error running rsync: {e}")
+            self._count('errors')
+            return None
+        
+        if result.returncode != 0:
+            stderr = result.stderr.strip()
+            reason = stderr.splitlines()[-1] if stderr else f"exit code {result.returncode}"
+            self._log(f"  ✗ Error syncing {source} -> {dest} with rsync: {reason}")
+            self._count('errors')
+            return None
+        
+        items = []
+        for line in result.stdout.splitlines():
+            flags, sep, rel_path = line.partition('|')
+            # Only regular files are of interest, not directories or symlinks
+            if sep and flags[1:2] == 'f':
+                items.append((flags, rel_path))
+        return items
+    
+    def _sync_directory_rsync(self, local_dir: Path, nas_dir: Path,
+                              recursive: bool = True,
+                              extensions: Optional[FrozenSet[str]] = None,
+                              emulator: Optional[str] = None) -> None:
+        """Sync a directory between local and NAS using rsync.
+        
+        Runs an upload pass and then a download pass, both with --update so
+        each side only receives files that are newer than its own copy.
+        
+        Args:
+            local_dir: Local directory path
+            nas_dir: NAS directory path
+            recursive: Whether to sync subdirectories recursively
+            extensions: Set of lowercase file extensions to sync (e.g., {'.ps2', '.gci'})
+            emulator: Emulator name for backup organization (e.g., 'PCSX2', 'Dolphin')
+        """
+        options = ['--update']
+        if not recursive:
+            options.append('--exclude=*/')
+        if extensions is not None:
+            if recursive:
+                options.append('--include=*/')
+            for ext in sorted(extensions):
+                options += [f'--include=*{ext}', f'--include=*{ext.upper()}']
+            options += ['--exclude=*', '--prune-empty-dirs']
+        
+        uploaded = 0
+        if local_dir.exists():
+            backup = self._monthly_backups_active and emulator and nas_dir.exists()
+            items = None
+            if backup or self.dry_run:
+                # Find which existing NAS files would be replaced ('+' marks new files)
+                items = self._run_rsync(local_dir, nas_dir, options + ['--dry-run'])
+                if items is None:
+                    return
+                if backup:
+                    backup_dir, prefix = self._backup_target(nas_dir, emulator)
+                    nas_base = os.fspath(nas_dir) + os.sep
+                    for flags, rel_path in items:
+                        if flags.startswith('>f') and '+' not in flags:
+                            self._create_monthly_backup_one(nas_base + rel_path,
+                                                            prefix + rel_path, backup_dir)
+            if not self.dry_run:
+                self._ensure_dir(str(nas_dir))
+                items = self._run_rsync(local_dir, nas_dir, options)
+                if items is None:
+                    return
+            
+            for flags, rel_path in items:
+                if flags.startswith('>f'):
+                    if self.dry_run:
+                        self._log(f"  [DRY RUN] Would upload: {os.path.basename(rel_path)}")
+                    else:
+                        self._log(f"  ↑ Uploaded: {os.path.basename(rel_path)}")
+                    self._count('uploaded')
+                    uploaded += 1
+        
+        if nas_dir.exists():
+            if self.dry_run:
+                options.append('--dry-run')
+            else:
+                self._ensure_dir(str(local_dir))
+            items = self._run_rsync(nas_dir, local_dir, options)
+            if items is None:
+                return
+            
+            unchanged = 0
+            for flags, rel_path in items:
+                if flags.startswith('>f'):
+                    if self.dry_run:
+                        self._log(f"  [DRY RUN] Would download: {os.path.basename(rel_path)}")
+                    else:
+                        self._log(f"  ↓ Downloaded: {os.path.basename(rel_path)}")
+                    self._count('downloaded')
+                elif flags.startswith('.f'):
+                    unchanged += 1
+            
+            # Files uploaded by the first pass show up as unchanged here
+            with self._stats_lock:
+                self.sync_stats['skipped'] += max(unchanged - uploaded, 0)
+    
+    def _backup_tree_rsync(self, nas_dir: Path, emulator: str) -> None:
+        """Create this month's backup of a NAS emulator directory using rsync.
+        
+        Files already backed up this month are left alone. Files unchanged
+        since the most recent earlier backup are hard-linked to it with
+        --link-dest instead of being copied again.
+        
+        Args:
+            nas_dir: NAS directory of the emulator (e.g., nas_path/PCSX2)
+            emulator: Emulator name (e.g., 'PCSX2', 'Dolphin')
+        """
+        if not self.monthly_backups:
+            return
+        
+        backup_root = self._backup_root
+        backup_month = time.strftime('%Y-%m')
+        backup_dir = backup_root / backup_month / emulator
+        
+        options = ['--ignore-existing']
+        if backup_root.exists():
+            previous = sorted(
+                name for name in os.listdir(backup_root)
+                if re.fullmatch(r'\d{4}-\d{2}', name) and name < backup_month
+                and (backup_root / name / emulator).is_dir()
+            )
+            if previous:
+                options.append(f'--link-dest={backup_root / previous[-1] / emulator}')
+        
+        if self.dry_run:
+            options.append('--dry-run')
+        else:
+            self._ensure_dir(str(backup_dir))
+        
+        items = self._run_rsync(nas_dir, backup_dir, options)
+        if items is None:
+            return
+        
+        for flags, rel_path in items:
+            # '>' marks copied files, 'h' files hard-linked to the previous backup
+            if flags[0] in '>ch':
+                if self.dry_run:
+                    self._log(f"  [DRY RUN] Would create backup: {backup_month}/{emulator}/{rel_path}")
+                else:
+                    self._log(f"  💾 Backed up: {rel_path} -> backups/{backup_month}/")
+                self._count('backed_up')
     
     def _sync_directory(self, local_dir: Path, nas_dir: Path, 
-                       recursive: bool = True, extensions: List[str] = None,
+                       recursive: bool = True,
+                       extensions: Optional[FrozenSet[str]] = None,
                        emulator: Optional[str] = None) -> None:
         """Sync all files in a directory between local and NAS.
         
@@ -217,97 +1297,431 @@ class SaveSync:
             local_dir: Local directory path
             nas_dir: NAS directory path
             recursive: Whether to sync subdirectories recursively
-            extensions: List of file extensions to sync (e.g., ['.ps2', '.gci'])
+            extensions: Set of lowercase file extensions to sync (e.g., {'.ps2', '.gci'})
             emulator: Emulator name for backup organization (e.g., 'PCSX2', 'Dolphin')
         """
-        local_dir = local_dir.expanduser()
+        if self.use_rsync:
+            self._sync_directory_rsync(local_dir, nas_dir, recursive, extensions, emulator)
+            self._flush_log()
+            return
         
-        # Collect all files from both locations
-        local_files = set()
-        nas_files = set()
+        # Within the manifest TTL, files whose local [mtime, size] match the
+        # last run are trusted to still be in sync with the NAS
+        manifest_key = f"{local_dir} -> {nas_dir}"
+        previous = self._manifest.get(manifest_key) if self.manifest_enabled else None
+        trusted = {}
+        if (previous and not self.force
+                and time.time() - previous.get('verified_at', 0) < self.manifest_ttl):
+            trusted = previous.get('files', {})
         
-        if local_dir.exists():
-            if recursive:
-                for file_path in local_dir.rglob('*'):
-                    if file_path.is_file():
-                        if extensions is None or file_path.suffix.lower() in extensions:
-                            rel_path = file_path.relative_to(local_dir)
-                            local_files.add(rel_path)
-            else:
-                for file_path in local_dir.glob('*'):
-                    if file_path.is_file():
-                        if extensions is None or file_path.suffix.lower() in extensions:
-                            rel_path = file_path.relative_to(local_dir)
-                            local_files.add(rel_path)
+        if trusted:
+            # If the local tree is exactly as it was left by the last run
+            # (no file added, removed or modified), there is nothing to sync
+            # and the NAS doesn't need to be read at all
+            local_entries = list(self._walk(local_dir, recursive, extensions))
+            if (len(local_entries) == len(trusted)
+                    and all(trusted.get(rel_path) == self._manifest_entry(local_stat)
+                            for rel_path, local_stat in local_entries)):
+                self._log("  No local changes since the last sync, skipping NAS check")
+                with self._stats_lock:
+                    self.sync_stats['skipped'] += len(local_entries)
+                self._flush_log()
+                return
+            # The NAS is only listed; stats are fetched on demand
+            nas_entries = list(self._walk(nas_dir, recursive, extensions, stat=False))
+        else:
+            # Collect all files and their metadata from both locations at once;
+            # the local scan finishes while the NAS scan is still waiting on the network
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                local_scan = executor.submit(list, self._walk(local_dir, recursive, extensions))
+                nas_scan = executor.submit(list, self._walk(nas_dir, recursive, extensions))
+                local_entries = local_scan.result()
+                nas_entries = nas_scan.result()
         
-        if nas_dir.exists():
-            if recursive:
-                for file_path in nas_dir.rglob('*'):
-                    if file_path.is_file():
-                        if extensions is None or file_path.suffix.lower() in extensions:
-                            rel_path = file_path.relative_to(nas_dir)
-                            nas_files.add(rel_path)
+        # Sync all unique files, except those the manifest says are in sync
+        synced = {}
+        jobs = []
+        for rel_path, local_stat, nas_stat, on_nas in self._merge_walks(local_entries, nas_entries):
+            # Files that were only listed on the NAS get stat'ed when synced
+            stat_nas = on_nas and nas_stat is None
+            if (stat_nas and local_stat is not None
+                    and trusted.get(rel_path) == self._manifest_entry(local_stat)):
+                self._count('skipped')
+                synced[rel_path] = trusted[rel_path]
+                continue
+            jobs.append((rel_path, local_stat, nas_stat, stat_nas))
+        
+        local_base = os.fspath(local_dir) + os.sep
+        nas_base = os.fspath(nas_dir) + os.sep
+        if not self.dry_run:
+            self._prepare_dirs(local_base, nas_base, jobs)
+        
+        backup_target = None
+        if self._monthly_backups_active and emulator:
+            backup_target = self._backup_target(nas_dir, emulator)
+        
+        import asyncio
+        
+        async def sync_files():
+            # Created in the running loop; before Python 3.10 a semaphore
+            # is bound to the loop current when it is created
+            semaphore = asyncio.Semaphore(self.parallel_workers)
+            return await self._sync_files_async(asyncio.get_running_loop(), semaphore,
+                                                local_base, nas_base, jobs,
+                                                backup_target, progress)
+        
+        # A progress bar replaces the per-file messages (errors are still shown)
+        progress = None
+        if self.show_progress and jobs:
+            progress = self._tqdm(total=len(jobs), unit='file', leave=False)
+        try:
+            results = asyncio.run(sync_files())
+        finally:
+            if progress is not None:
+                progress.close()
+        for rel_path, action, local_stat, nas_stat in results:
+            # Record the metadata the local copy has once in sync
+            if action in ('upload', 'skip') and local_stat is not None:
+                synced[rel_path] = self._manifest_entry(local_stat)
+            elif action == 'download':
+                synced[rel_path] = self._manifest_entry(nas_stat)
+        self._flush_log()
+        
+        if self.manifest_enabled and not self.dry_run:
+            # Directories synced in parallel share the manifest file
+            with self._manifest_lock:
+                self._manifest[manifest_key] = {
+                    # A trusted run didn't check the NAS, so keep the original time
+                    'verified_at': previous['verified_at'] if trusted else time.time(),
+                    'files': synced,
+                }
+                self._save_manifest()
+    
+    @staticmethod
+    def _manifest_entry(file_stat: os.stat_result) -> List:
+        """Return the [mtime, size] recorded in the manifest for a file.
+        
+        Args:
+            file_stat: os.stat_result of the file
+        """
+        return [file_stat.st_mtime, file_stat.st_size]
+    
+    def _merge_walks(self, local_entries: List[Tuple], nas_entries: List[Tuple]
+                     ) -> Iterator[Tuple[str, Optional[os.stat_result],
+                                         Optional[os.stat_result], bool]]:
+        """Merge the sorted results of a local and a NAS walk by relative path.
+        
+        Args:
+            local_entries: Tuples yielded by _walk() for the local directory
+            nas_entries: Tuples yielded by _walk() for the NAS directory
+            
+        Yields:
+            Tuples of (relative path, local os.stat_result, NAS os.stat_result,
+            whether the file is on the NAS), with None for stat results that
+            are missing or weren't fetched
+        """
+        merged = heapq.merge(
+            ((rel_path, 0, file_stat) for rel_path, file_stat in local_entries),
+            ((rel_path, 1, file_stat) for rel_path, file_stat in nas_entries),
+        )
+        for rel_path, group in itertools.groupby(merged, key=lambda item: item[0]):
+            local_stat = nas_stat = None
+            on_nas = False
+            for _, side, file_stat in group:
+                if side == 0:
+                    local_stat = file_stat
+                else:
+                    on_nas = True
+                    nas_stat = file_stat
+            yield rel_path, local_stat, nas_stat, on_nas
+    
+    def _prepare_dirs(self, local_base: str, nas_base: str, jobs: List[Tuple]) -> None:
+        """Create the destination directories a directory sync will need.
+        
+        Each missing directory is created once, before any file is copied.
+        Parents of files that exist are recorded as existing without a
+        mkdir call, so _ensure_dir() in _sync_file never touches the disk.
+        
+        Args:
+            local_base: Local directory path ending in a separator
+            nas_base: NAS directory path ending in a separator
+            jobs: Jobs passed to _sync_files_async
+        """
+        needed = set()
+        for rel_path, local_stat, nas_stat, stat_nas in jobs:
+            local_parent = os.path.dirname(local_base + rel_path)
+            nas_parent = os.path.dirname(nas_base + rel_path)
+            if local_stat is None:
+                needed.add(local_parent)
             else:
-                for file_path in nas_dir.glob('*'):
-                    if file_path.is_file():
-                        if extensions is None or file_path.suffix.lower() in extensions:
-                            rel_path = file_path.relative_to(nas_dir)
-                            nas_files.add(rel_path)
-        
-        # Sync all unique files
-        all_files = local_files | nas_files
-        for rel_path in sorted(all_files):
-            local_file = local_dir / rel_path
-            nas_file = nas_dir / rel_path
-            self._sync_file(local_file, nas_file, emulator=emulator)
+                self._remember_dir(local_parent)
+            if nas_stat is not None or stat_nas:
+                self._remember_dir(nas_parent)
+            else:
+                needed.add(nas_parent)
+        
+        # Shortest first, so deeper directories only add their last component
+        for directory in sorted(needed, key=len):
+            try:
+                self._ensure_dir(directory)
+            except OSError:
+                # Reported for each affected file when it is copied
+                pass
+    
+    async def _sync_files_async(self, loop: 'asyncio.AbstractEventLoop',
+                                semaphore: 'asyncio.Semaphore',
+                                local_base: str, nas_base: str,
+                                jobs: List[Tuple[str, Optional[os.stat_result],
+                                                 Optional[os.stat_result], bool]],
+                                backup_target: Optional[Tuple[Path, str]] = None,
+                                progress: Optional['tqdm'] = None) -> List[Tuple]:
+        """Sync many files concurrently, overlapping their NAS round trips.
+        
+        Each file is first planned with _plan_sync(), which only reads
+        metadata (and contents, when hashing). Up to parallel_workers files
+        are planned at once, and small files are copied right away by the
+        same threads. Copies of files larger than SMALL_FILE_SIZE are bound
+        by bandwidth instead, so they go to a separate pool of
+        large_file_workers threads and don't hold up the small ones.
+        
+        The blocking calls run on thread pools, since regular files can't be
+        read or written asynchronously.
+        
+        Args:
+            loop: Running event loop
+            semaphore: Limits the number of files being planned or copied at once
+            local_base: Local directory path ending in a separator
+            nas_base: NAS directory path ending in a separator
+            jobs: Tuples of (relative path, local os.stat_result, NAS os.stat_result,
+                whether the NAS file still has to be stat'ed)
+            backup_target: Result of _backup_target() for the NAS directory,
+                or None if replaced NAS files aren't backed up
+            progress: Progress bar to advance as files complete, if any
+            
+        Returns:
+            Tuples of (relative path, action taken by _sync_file, local
+            os.stat_result, NAS os.stat_result) in the order of jobs
+        """
+        # Workers report to the same message group as the calling thread
+        group = getattr(self._log_group, 'lines', None)
+        with ThreadPoolExecutor(max_workers=self.parallel_workers,
+                                initializer=self._join_log_group,
+                                initargs=(group,)) as executor, \
+                ThreadPoolExecutor(max_workers=self.large_file_workers,
+                                   initializer=self._join_log_group,
+                                   initargs=(group,)) as large_executor:
+            tasks = [
+                loop.create_task(self._sync_file_async(
+                    loop, executor, large_executor, semaphore,
+                    local_base + rel_path, nas_base + rel_path, rel_path,
+                    local_stat, nas_stat, stat_nas, backup_target, progress))
+                for rel_path, local_stat, nas_stat, stat_nas in jobs
+            ]
+            return [await task for task in tasks]
+    
+    async def _sync_file_async(self, loop: 'asyncio.AbstractEventLoop',
+                               executor: Executor, large_executor: Executor,
+                               semaphore: 'asyncio.Semaphore',
+                               local_path: str, nas_path: str, rel_path: str,
+                               local_stat: Optional[os.stat_result],
+                               nas_stat: Optional[os.stat_result],
+                               stat_nas: bool,
+                               backup_target: Optional[Tuple[Path, str]],
+                               progress: Optional['tqdm'] = None) -> Tuple:
+        """Sync a single file on the executors once a concurrency slot is free.
+        
+        Args:
+            loop: Running event loop
+            executor: Thread pool planning files and copying small ones
+            large_executor: Thread pool copying files larger than SMALL_FILE_SIZE
+            semaphore: Limits the number of files being planned or copied on executor
+            local_path: Local file path
+            nas_path: NAS file path
+            rel_path: Path relative to the synced directories
+            local_stat: os.stat_result of the local file, or None if it doesn't exist
+            nas_stat: os.stat_result of the NAS file, or None if it doesn't exist
+            stat_nas: Whether nas_stat must first be fetched from the NAS
+            backup_target: Result of _backup_target() for the NAS directory,
+                or None if replaced NAS files aren't backed up
+            progress: Progress bar to advance once the file is done, if any
+            
+        Returns:
+            Tuple of (relative path, action taken, local_stat, nas_stat)
+        """
+        backup_dir = backup_rel_path = None
+        if backup_target is not None:
+            backup_dir, prefix = backup_target
+            backup_rel_path = prefix + rel_path
+        
+        async with semaphore:
+            if stat_nas:
+                nas_stat = await loop.run_in_executor(executor, self._get_file_stat, nas_path)
+            action = await loop.run_in_executor(executor, self._plan_sync, local_path,
+                                                nas_path, 'auto', local_stat, nas_stat)
+            aligned = action == 'align' and not self.dry_run
+            execute = functools.partial(
+                self._execute_sync, local_path, nas_path, action, local_stat, nas_stat,
+                quiet=progress is not None, backup_dir=backup_dir,
+                backup_rel_path=backup_rel_path)
+            source_stat = local_stat if action == 'upload' else nas_stat
+            large = (action in ('upload', 'download')
+                     and source_stat.st_size > self.SMALL_FILE_SIZE)
+            if not large:
+                action = await loop.run_in_executor(executor, execute)
+        if large:
+            action = await loop.run_in_executor(large_executor, execute)
+        if aligned:
+            # Record the new mtime of a retimed local copy in the manifest
+            local_stat = self._stat_cache.get(local_path) or local_stat
+        if progress is not None:
+            progress.set_postfix_str(rel_path, refresh=False)
+            progress.update(1)
+        return rel_path, action, local_stat, nas_stat
+    
+    def sync_emulator(self, name: str) -> None:
+        """Sync the save files of one emulator.
+        
+        Args:
+            name: Emulator key in the configuration (e.g., 'pcsx2', 'dolphin')
+        """
+        self._run_sync_tasks(self._emulator_tasks(name))
+    
+    def _emulator_tasks(self, name: str) -> List[functools.partial]:
+        """Build the directory syncs of one emulator.
+        
+        Args:
+            name: Emulator key in the configuration (e.g., 'pcsx2', 'dolphin')
+            
+        Returns:
+            Sync tasks for _run_sync_tasks
+        """
+        build_tasks, _, _ = self._EMULATOR_HANDLERS[name]
+        return getattr(self, build_tasks)()
     
     def sync_pcsx2(self) -> None:
         """Sync PCSX2 (PS2) save files."""
-        config = self.config['emulators'].get('pcsx2', {})
+        self.sync_emulator('pcsx2')
+    
+    def _pcsx2_tasks(self) -> List[functools.partial]:
+        """Build the directory sync of PCSX2 (PS2) save files.
         
-        if not config.get('enabled', False):
-            print("PCSX2 sync is disabled")
-            return
+        Returns:
+            Sync tasks for _run_sync_tasks
+        """
+        emu = self._emulator_configs.get('pcsx2')
         
-        local_path = Path(config['save_path']).expanduser()
-        nas_path = self.nas_path / 'PCSX2'
+        if emu is None:
+            return [functools.partial(self._log, "PCSX2 sync is disabled")]
         
-        print(f"\nSyncing PCSX2 saves:")
-        print(f"  Local: {local_path}")
-        print(f"  NAS: {nas_path}")
+        local_path = emu['local']
+        nas_path = emu['nas']
+        
+        banner = [f"\nSyncing PCSX2 saves:",
+                  f"  Local: {local_path}",
+                  f"  NAS: {nas_path}"]
         
         # Sync memory card files
-        self._sync_directory(local_path, nas_path, recursive=True, emulator='PCSX2')
+        return [functools.partial(self._sync_task, banner, local_path, nas_path,
+                                  emu['extensions'], 'PCSX2')]
     
     def sync_dolphin(self) -> None:
         """Sync Dolphin (Wii/GameCube) save files."""
-        config = self.config['emulators'].get('dolphin', {})
+        self.sync_emulator('dolphin')
+    
+    def _dolphin_tasks(self) -> List[functools.partial]:
+        """Build the directory syncs of Dolphin (Wii/GameCube) save files.
         
-        if not config.get('enabled', False):
-            print("Dolphin sync is disabled")
-            return
+        Returns:
+            Sync tasks for _run_sync_tasks, one per save type
+        """
+        emu = self._emulator_configs.get('dolphin')
+        
+        if emu is None:
+            return [functools.partial(self._log, "Dolphin sync is disabled")]
         
-        base_path = Path(config['save_path']).expanduser()
-        nas_base = self.nas_path / 'Dolphin'
-        saves_config = config.get('saves', {})
+        base_path = emu['local']
+        nas_base = emu['nas']
+        saves = emu['saves']
         
-        print(f"\nSyncing Dolphin saves:")
-        print(f"  Local: {base_path}")
-        print(f"  NAS: {nas_base}")
+        banner = [f"\nSyncing Dolphin saves:",
+                  f"  Local: {base_path}",
+                  f"  NAS: {nas_base}"]
+        tasks = []
         
         # Sync Wii saves
-        if 'wii' in saves_config:
-            wii_local = base_path / saves_config['wii']
-            wii_nas = nas_base / 'Wii'
-            print(f"\n  Wii saves:")
-            self._sync_directory(wii_local, wii_nas, recursive=True, emulator='Dolphin')
+        if 'wii' in saves:
+            wii_nas = nas_base / self.DOLPHIN_NAS_DIRS['wii']
+            tasks.append(functools.partial(self._sync_task, banner + ["\n  Wii saves:"],
+                                           saves['wii'], wii_nas, emu['extensions'], 'Dolphin'))
+            banner = []
         
         # Sync GameCube saves
-        if 'gamecube' in saves_config:
-            gc_local = base_path / saves_config['gamecube']
-            gc_nas = nas_base / 'GC'
-            print(f"\n  GameCube saves:")
-            self._sync_directory(gc_local, gc_nas, recursive=True, emulator='Dolphin')
+        if 'gamecube' in saves:
+            gc_nas = nas_base / self.DOLPHIN_NAS_DIRS['gamecube']
+            tasks.append(functools.partial(self._sync_task, banner + ["\n  GameCube saves:"],
+                                           saves['gamecube'], gc_nas, emu['extensions'], 'Dolphin'))
+            banner = []
+        
+        if banner:
+            tasks.append(functools.partial(self._log, '\n'.join(banner)))
+        return tasks
+    
+    def _sync_task(self, banner: List[str], local_dir: Path, nas_dir: Path,
+                   extensions: Optional[FrozenSet[str]], emulator: str) -> None:
+        """Print a banner and sync one directory tree.
+        
+        Args:
+            banner: Lines describing what is being synced
+            local_dir: Local directory path
+            nas_dir: NAS directory path
+            extensions: Set of lowercase file extensions to sync, or None for all
+            emulator: Emulator name for backup organization (e.g., 'PCSX2', 'Dolphin')
+        """
+        for line in banner:
+            self._log(line)
+        self._flush_log()
+        self._sync_directory(local_dir, nas_dir, recursive=True,
+                             extensions=extensions, emulator=emulator)
+    
+    def _run_sync_tasks(self, tasks: List[functools.partial]) -> None:
+        """Run sync tasks, up to self.jobs (by default all) of them at once.
+        
+        Output stays in task order: the messages of each parallel task are
+        collected and printed once it and all tasks before it have finished.
+        
+        Args:
+            tasks: Callables returned by _pcsx2_tasks and _dolphin_tasks
+        """
+        workers = self.jobs or len(tasks)
+        if workers == 1 or len(tasks) < 2:
+            for task in tasks:
+                task()
+            self._flush_log()
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for lines in executor.map(self._run_grouped, tasks):
+                    with self._log_lock:
+                        self._log_lines.extend(lines)
+                        self._write_log_lines()
+        
+        self._save_hash_index()
+    
+    def _run_grouped(self, task: functools.partial) -> List[str]:
+        """Run a sync task in the current thread, collecting its messages.
+        
+        Args:
+            task: Callable returned by _pcsx2_tasks or _dolphin_tasks
+            
+        Returns:
+            Messages the task would have printed
+        """
+        lines = []
+        self._join_log_group(lines)
+        try:
+            task()
+        finally:
+            self._join_log_group(None)
+        return lines
     
     def sync_all(self) -> None:
         """Sync all enabled emulators."""
@@ -330,14 +1744,15 @@ class SaveSync:
                     print(f"Error creating NAS directory: {e}")
                     return
         
-        # Sync each emulator
+        # Sync each emulator, in parallel when more than one job is allowed
         emulators = self.config.get('emulators', {})
+        tasks = []
         
-        if 'pcsx2' in emulators:
-            self.sync_pcsx2()
+        for emu_name in emulators:
+            if emu_name in self._EMULATOR_HANDLERS:
+                tasks += self._emulator_tasks(emu_name)
         
-        if 'dolphin' in emulators:
-            self.sync_dolphin()
+        self._run_sync_tasks(tasks)
         
         # Print summary
         print("\n" + "=" * 60)
@@ -365,28 +1780,21 @@ class SaveSync:
             return
         
         # Get current month for backup
-        now = datetime.now()
-        backup_month = now.strftime('%Y-%m')
+        backup_month = time.strftime('%Y-%m')
+        backup_month_dir = self._backup_root / backup_month
         print(f"\nCreating backups for {backup_month}...")
         
-        # Process each emulator
-        emulators = self.config.get('emulators', {})
-        
-        if 'pcsx2' in emulators and emulators['pcsx2'].get('enabled', False):
-            nas_path = self.nas_path / 'PCSX2'
-            print(f"\nBacking up PCSX2 saves from: {nas_path}")
-            if nas_path.exists():
-                for file_path in nas_path.rglob('*'):
-                    if file_path.is_file():
-                        self._create_monthly_backup(file_path, 'PCSX2')
-        
-        if 'dolphin' in emulators and emulators['dolphin'].get('enabled', False):
-            nas_base = self.nas_path / 'Dolphin'
-            print(f"\nBacking up Dolphin saves from: {nas_base}")
-            if nas_base.exists():
-                for file_path in nas_base.rglob('*'):
-                    if file_path.is_file():
-                        self._create_monthly_backup(file_path, 'Dolphin')
+        # Process each enabled emulator
+        for emu_name, emu in self._emulator_configs.items():
+            _, _, emulator = self._EMULATOR_HANDLERS[emu_name]
+            nas_dir = emu['nas']
+            print(f"\nBacking up {emulator} saves from: {nas_dir}")
+            if nas_dir.exists():
+                if self.use_rsync:
+                    self._backup_tree_rsync(nas_dir, emulator)
+                else:
+                    self._backup_tree(nas_dir, backup_month_dir / emulator)
+                self._flush_log()
         
         # Print summary
         print("\n" + "=" * 60)
@@ -408,84 +1816,63 @@ class SaveSync:
         
         print("Scanning for existing saves...\n")
         
-        for emu_name, emu_config in emulators.items():
-            if not emu_config.get('enabled', False):
+        for emu_name in emulators:
+            if emu_name not in self._emulator_configs:
                 continue
             
-            if emu_name == 'pcsx2':
-                self._init_emulator_pcsx2(emu_config)
-            elif emu_name == 'dolphin':
-                self._init_emulator_dolphin(emu_config)
+            _, init_emulator, _ = self._EMULATOR_HANDLERS[emu_name]
+            getattr(self, init_emulator)()
+        
+        self._save_hash_index()
         
         print("\n" + "=" * 60)
         print("Initialization complete!")
         print("\nYou can now run 'python3 retrosavesync.py' to sync your saves.")
         print("=" * 60)
     
-    def _init_emulator_pcsx2(self, config: Dict) -> None:
+    def _init_emulator_pcsx2(self) -> None:
         """Initialize PCSX2 saves."""
-        local_path = Path(config['save_path']).expanduser()
-        nas_path = self.nas_path / 'PCSX2'
-        
-        local_files = set()
-        nas_files = set()
-        
-        if local_path.exists():
-            local_files = {f.relative_to(local_path) for f in local_path.rglob('*') if f.is_file()}
-        
-        if nas_path.exists():
-            nas_files = {f.relative_to(nas_path) for f in nas_path.rglob('*') if f.is_file()}
-        
-        self._init_prompt_and_sync('PCSX2', local_path, nas_path, local_files, nas_files)
+        emu = self._emulator_configs['pcsx2']
+        self._init_directory('PCSX2', emu['local'], emu['nas'], emu['extensions'])
     
-    def _init_emulator_dolphin(self, config: Dict) -> None:
+    def _init_emulator_dolphin(self) -> None:
         """Initialize Dolphin saves."""
-        base_path = Path(config['save_path']).expanduser()
-        nas_base = self.nas_path / 'Dolphin'
-        saves_config = config.get('saves', {})
+        emu = self._emulator_configs['dolphin']
         
-        # Handle Wii saves
-        if 'wii' in saves_config:
-            wii_local = base_path / saves_config['wii']
-            wii_nas = nas_base / 'Wii'
-            
-            local_files = set()
-            nas_files = set()
-            
-            if wii_local.exists():
-                local_files = {f.relative_to(wii_local) for f in wii_local.rglob('*') if f.is_file()}
-            
-            if wii_nas.exists():
-                nas_files = {f.relative_to(wii_nas) for f in wii_nas.rglob('*') if f.is_file()}
-            
-            self._init_prompt_and_sync('Dolphin (Wii)', wii_local, wii_nas, local_files, nas_files)
+        # Handle Wii and GameCube saves
+        for save_type, label in (('wii', 'Wii'), ('gamecube', 'GameCube')):
+            if save_type in emu['saves']:
+                self._init_directory(f'Dolphin ({label})', emu['saves'][save_type],
+                                     emu['nas'] / self.DOLPHIN_NAS_DIRS[save_type],
+                                     emu['extensions'])
+    
+    def _init_directory(self, name: str, local_path: Path, nas_path: Path,
+                        extensions: Optional[FrozenSet[str]]) -> None:
+        """Scan a local and NAS directory, then prompt and sync them.
         
-        # Handle GameCube saves
-        if 'gamecube' in saves_config:
-            gc_local = base_path / saves_config['gamecube']
-            gc_nas = nas_base / 'GC'
-            
-            local_files = set()
-            nas_files = set()
-            
-            if gc_local.exists():
-                local_files = {f.relative_to(gc_local) for f in gc_local.rglob('*') if f.is_file()}
-            
-            if gc_nas.exists():
-                nas_files = {f.relative_to(gc_nas) for f in gc_nas.rglob('*') if f.is_file()}
-            
-            self._init_prompt_and_sync('Dolphin (GameCube)', gc_local, gc_nas, local_files, nas_files)
+        Args:
+            name: Display name (e.g., 'PCSX2', 'Dolphin (Wii)')
+            local_path: Local save directory
+            nas_path: NAS save directory
+            extensions: Set of lowercase file extensions to sync, or None for all
+        """
+        # Missing directories simply have no files
+        local_files = self._collect_files(local_path, extensions=extensions)
+        nas_files = self._collect_files(nas_path, extensions=extensions)
+        
+        self._init_prompt_and_sync(name, local_path, nas_path, local_files, nas_files)
     
     def _init_prompt_and_sync(self, name: str, local_path: Path, nas_path: Path, 
-                              local_files: set, nas_files: set) -> None:
+                              local_files: Dict[str, os.stat_result],
+                              nas_files: Dict[str, os.stat_result]) -> None:
         """Prompt user and perform initial sync for an emulator.
         
         Args:
             name: Display name for the emulator (e.g., 'PCSX2', 'Dolphin (Wii)')
             local_path: Path to local save directory
             nas_path: Path to NAS save directory
-            local_files: Set of relative paths to local files
-            nas_files: Set of relative paths to NAS files
+            local_files: Mapping of relative paths to os.stat_result of local files
+            nas_files: Mapping of relative paths to os.stat_result of NAS files
         """
         print(f"\n{name}:")
         print(f"  Local: {local_path}")
@@ -537,21 +1924,33 @@ class SaveSync:
             print(f"  → Will download {nas_count} file(s) from NAS")
             direction = 'download'
         
-        # Perform the sync
-        all_files = local_files | nas_files
+        # Perform the sync; every local file, then the NAS-only ones, without
+        # building a union of both listings
+        all_files = itertools.chain(
+            local_files,
+            (rel_path for rel_path in nas_files if rel_path not in local_files),
+        )
         
         # Extract base emulator name for backup organization
         # Handles formats like 'PCSX2' or 'Dolphin (Wii)' -> 'Dolphin'
         emulator_name = name.split('(')[0].strip() if '(' in name else name
         
-        for rel_path in sorted(all_files):
-            local_file = local_path / rel_path
-            nas_file = nas_path / rel_path
-            self._sync_file(local_file, nas_file, direction=direction, emulator=emulator_name)
+        local_base = os.fspath(local_path) + os.sep
+        nas_base = os.fspath(nas_path) + os.sep
+        
+        # Each file is synced independently, so the order doesn't matter
+        for rel_path in all_files:
+            self._sync_file(local_base + rel_path, nas_base + rel_path,
+                            direction=direction, emulator=emulator_name,
+                            local_stat=local_files.get(rel_path),
+                            nas_stat=nas_files.get(rel_path))
+        self._flush_log()
 
 
 def main():
     """Main entry point for RetroSaveSync."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Synchronize emulator saves between local storage and NAS'
     )
@@ -562,7 +1961,7 @@ def main():
     )
     parser.add_argument(
         '-e', '--emulator',
-        choices=['all', 'pcsx2', 'dolphin'],
+        choices=['all', *SaveSync._EMULATOR_HANDLERS],
         default='all',
         help='Emulator to sync (default: all)'
     )
@@ -581,6 +1980,22 @@ def main():
         action='store_true',
         help='Interactive setup wizard for first-time use with existing saves'
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Number of save directories (PCSX2, Dolphin Wii, Dolphin GameCube) '
+             'to sync in parallel (default: all of them; 1 syncs one at a time)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Ignore the sync manifest and compare every file with the NAS'
+    )
+    parser.add_argument(
+        '--progress',
+        action='store_true',
+        help='Show a progress bar instead of a line per copied file (requires tqdm)'
+    )
     
     args = parser.parse_args()
     
@@ -591,7 +2006,10 @@ def main():
         sys.exit(1)
     
     try:
-        syncer = SaveSync(args.config, dry_run=args.dry_run)
+        syncer = SaveSync(args.config, dry_run=args.dry_run, progress=args.progress,
+                          jobs=args.jobs, force=args.force)
+        if args.progress and not syncer.show_progress:
+            print("Warning: --progress requires tqdm (pip install tqdm); showing per-file output")
         
         if args.init:
             syncer.initialize()
@@ -599,10 +2017,8 @@ def main():
             syncer.create_backups()
         elif args.emulator == 'all':
             syncer.sync_all()
-        elif args.emulator == 'pcsx2':
-            syncer.sync_pcsx2()
-        elif args.emulator == 'dolphin':
-            syncer.sync_dolphin()
+        else:
+            syncer.sync_emulator(args.emulator)
             
     except Exception as e:
         print(f"Error: {e}")